@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Regenerate the frozen isotope table module from `isotope_data.json`.
+
+The isotope table is static. Freezing it into a Python module removes the JSON
+parse from every interpreter start---the compiled .pyc is loaded directly.
+
+Run this script after editing `isotope_data.json`:
+
+    python build_tools/generate_isotope_table.py
+"""
+import json
+from os import path
+
+__author__ = "Deepansh Srivastava"
+__email__ = "srivastava.89@osu.edu"
+
+SPIN_SYSTEM_DIR = path.join(
+    path.dirname(path.dirname(path.abspath(__file__))),
+    "src",
+    "mrsimulator",
+    "spin_system",
+)
+
+HEADER = '''# -*- coding: utf-8 -*-
+"""Frozen isotope data table. Auto-generated from `isotope_data.json` by
+`build_tools/generate_isotope_table.py`. Do not edit by hand."""
+'''
+
+
+def generate():
+    with open(path.join(SPIN_SYSTEM_DIR, "isotope_data.json"), "rb") as file:
+        isotope_data = json.load(file)
+
+    # One field per line keeps the generated module black-compatible and
+    # within the 88-character flake8 limit.
+    lines = [HEADER, "ISOTOPE_DATA = {"]
+    for symbol, entry in isotope_data.items():
+        lines.append(f'    "{symbol}": {{')
+        lines.extend(f'        "{k}": {v!r},' for k, v in entry.items())
+        lines.append("    },")
+    lines.append("}")
+
+    with open(path.join(SPIN_SYSTEM_DIR, "_isotope_table.py"), "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    generate()
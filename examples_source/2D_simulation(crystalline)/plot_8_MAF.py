@@ -12,6 +12,7 @@ Wollastonite, ²⁹Si (I=1/2), MAF
 # :math:`^{29}\text{Si}` sites. The :math:`^{29}\text{Si}` tensor parameters
 # were obtained from Hansen `et al.` [#f1]_
 import matplotlib.pyplot as plt
+import numpy as np
 
 from mrsimulator import Simulator, SpinSystem, Site
 from mrsimulator.methods import Method2D
@@ -56,7 +57,7 @@ maf = Method2D(
             "label": "Anisotropic dimension",
             "events": [
                 {
-                    "rotor_angle": 90 * 3.14159 / 180,
+                    "rotor_angle": np.pi / 2,
                     "transition_query": [{"P": [-1], "D": [0]}],
                 }
             ],
@@ -68,7 +69,7 @@ maf = Method2D(
             "label": "Isotropic dimension",
             "events": [
                 {
-                    "rotor_angle": 54.735 * 3.14159 / 180,
+                    "rotor_angle": np.deg2rad(54.735),
                     "transition_query": [{"P": [-1], "D": [0]}],
                 }
             ],
@@ -102,7 +103,7 @@ processor = sp.SignalProcessor(
     ]
 )
 processed_data = processor.apply_operations(data=csdm_data).real
-processed_data /= processed_data.max()
+processed_data *= 1 / processed_data.max()
 
 # %%
 # The plot of the simulation after signal processing.
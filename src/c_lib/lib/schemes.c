@@ -199,6 +199,9 @@ MRS_fftw_scheme *create_fftw_scheme(unsigned int total_orientations,
   // }
   // fftw_plan_with_nthreads(2);
 
+  // The plan is created once per averaging scheme and reused for every spin
+  // system and orientation in the simulation, so the planning cost is paid
+  // once per simulation call, not per transform.
   fftw_scheme->the_fftw_plan = fftw_plan_many_dft(
       1, &nssb, total_orientations, fftw_scheme->vector, NULL, total_orientations, 1,
       fftw_scheme->vector, NULL, total_orientations, 1, FFTW_FORWARD, FFTW_ESTIMATE);
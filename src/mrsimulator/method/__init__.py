@@ -30,6 +30,11 @@ from .utils import tip_angle_and_phase_list
 __author__ = ["Deepansh J. Srivastava", "Matthew D. Giammar"]
 __email__ = ["srivastava.89@osu.edu", "giammar.7@buckeyemail.osu.edu"]
 
+# Memoized transition pathway segments and weights, keyed by the method queries
+# and the spin system site isotopes. See Method._pathway_cache_key.
+_PATHWAY_CACHE = {}
+_PATHWAY_CACHE_MAX_SIZE = 1024
+
 
 class Method(Parseable):
     r"""Base Method class. A method class represents the NMR method.
@@ -492,13 +497,35 @@ class Method(Parseable):
             )
         return amp
 
+    def _pathway_cache_key(self, spin_system) -> tuple:
+        """Return a hashable key identifying the pathway enumeration inputs: the
+        method channels, the event queries, and the spin system site isotopes."""
+        events = tuple(
+            (evt.__class__.__name__, str(evt.json()))
+            for dim in self.spectral_dimensions
+            for evt in dim.events
+        )
+        isotopes = tuple(site.isotope.symbol for site in spin_system.sites)
+        return (tuple(item.symbol for item in self.channels), events, isotopes)
+
     def _get_transition_pathway_and_weights_np(self, spin_system):
+        # Pathway enumeration is deterministic given the method queries and the
+        # site isotopes. Memoize so that re-simulating the same method over
+        # identical systems (fitting, parameter sweeps) skips the enumeration.
+        key = self._pathway_cache_key(spin_system)
+        if key in _PATHWAY_CACHE:
+            return _PATHWAY_CACHE[key]
+
         segments = self._get_transition_pathways_np(spin_system)
         weights = self._get_transition_pathway_weights(segments, spin_system)
-        return segments, weights
         # indexes = np.where(weights != 0)[0]
         # return np.asarray(segments)[indexes], weights[indexes]
 
+        if len(_PATHWAY_CACHE) >= _PATHWAY_CACHE_MAX_SIZE:
+            _PATHWAY_CACHE.clear()
+        _PATHWAY_CACHE[key] = (segments, weights)
+        return segments, weights
+
     def get_transition_pathways(self, spin_system) -> List[TransitionPathway]:
         """Return a list of transition pathways from the given spin system that satisfy
         the query selection criterion of the method.
@@ -8,14 +8,14 @@ from typing import Union
 import numpy as np
 from mrsimulator.utils.parseable import Parseable
 from pydantic import Field
+from pydantic import validator
 
 from .frequency_contrib import default_freq_contrib
 from .frequency_contrib import freq_list_all
 from .frequency_contrib import FrequencyEnum
 from .query import MixingQuery
 from .query import TransitionQuery
-from .utils import D_symmetry_indexes
-from .utils import P_symmetry_indexes
+from .utils import filter_transitions_mask
 
 __author__ = "Deepansh J. Srivastava"
 __email__ = "srivastava.89@osu.edu"
@@ -77,6 +77,14 @@ class BaseEvent(Parseable):
     class Config:
         validate_assignment = True
 
+    @validator("rotor_frequency")
+    def canonicalize_rotor_frequency(cls, v):
+        """Map an infinite rotor frequency to the 1e12 Hz sentinel used across
+        the library, so the C kernels never see (or test for) float infinity."""
+        if v is not None and np.isinf(v):
+            return 1.0e12
+        return v
+
     @classmethod
     def parse_dict_with_units(cls, py_dict: dict):
         """Parse the physical quantities of an Event object from a python dictionary
@@ -112,14 +120,14 @@ class BaseEvent(Parseable):
         """
 
         symmetry_permutations = self.permutation(isotopes, channels)
-        # print("symmetry_permutations", symmetry_permutations)
-        segment = []
-        for item in symmetry_permutations:
-            st = all_transitions[:]
-            # print(item["P"].size, item["D"].size)
-            st = st[P_symmetry_indexes(st, item["P"])] if item["P"].size > 0 else st
-            st = st[D_symmetry_indexes(st, item["D"])] if item["D"].size > 0 else st
-            segment += [st]
+        # Combine the P and D query masks and apply a single fancy-index per
+        # permutation instead of filtering in two passes.
+        segment = [
+            all_transitions[
+                filter_transitions_mask(all_transitions, item["P"], item["D"])
+            ]
+            for item in symmetry_permutations
+        ]
         return np.vstack(segment)
 
 
@@ -19,24 +19,42 @@ method2 = Method(
     spectral_dimensions=[{"events": [{"transition_query": [{"ch1": {"P": [-2]}}]}]}],
 )
 
+# The transition tests only read the spin systems, so the shared instances are
+# built once per module instead of once per test.
+system_13C = SpinSystem(sites=[{"isotope": "13C"}])
+system_13C_1H = SpinSystem(sites=[{"isotope": "13C"}, {"isotope": "1H"}])
+system_13C_13C = SpinSystem(sites=[{"isotope": "13C"}, {"isotope": "13C"}])
+system_1H_1H = SpinSystem(sites=[{"isotope": "1H"}, {"isotope": "1H"}])
+system_13C_13C_14N = SpinSystem(
+    sites=[{"isotope": "13C"}, {"isotope": "13C"}, {"isotope": "14N"}]
+)
+
+
+def assert_transition_pathways(got, expected_states, expected_weights):
+    """Compare the pathways against the expected (n_pathways, n_events, 2,
+    n_sites) state array and weights with two vectorized comparisons."""
+    got_states = np.stack([item.to_array() for item in got])
+    got_weights = np.asarray([item.weight for item in got])
+    assert np.array_equal(got_states, expected_states), f"States do not match: {got}"
+    assert np.allclose(got_weights, expected_weights), f"Weights do not match: {got}"
+
 
 def check_transition_set(got, expected):
     assert len(got) == len(expected), "Inconsistent transition pathway count"
-    for item in got:
-        assert item in expected, f"Transition pathways not found: {item}"
+    got_keys = {item._key() for item in got}
+    expected_keys = {item._key() for item in expected}
+    assert got_keys == expected_keys, f"Transition pathways do not match: {got}"
 
 
 def test_00():
-    system = SpinSystem(sites=[{"isotope": "13C"}])
-    tr = method1.get_transition_pathways(system)
+    tr = method1.get_transition_pathways(system_13C)
 
     expected = [TransitionPathway([{"final": [-0.5], "initial": [0.5]}])]
     check_transition_set(tr, expected)
 
 
 def test_01():
-    system = SpinSystem(sites=[{"isotope": "13C"}, {"isotope": "1H"}])
-    tr = method1.get_transition_pathways(system)
+    tr = method1.get_transition_pathways(system_13C_1H)
     expected = [
         TransitionPathway([{"final": [-0.5, -0.5], "initial": [0.5, -0.5]}]),
         TransitionPathway([{"final": [-0.5, 0.5], "initial": [0.5, 0.5]}]),
@@ -45,8 +63,7 @@ def test_01():
 
 
 def test_02():
-    system = SpinSystem(sites=[{"isotope": "13C"}, {"isotope": "13C"}])
-    tr = method1.get_transition_pathways(system)
+    tr = method1.get_transition_pathways(system_13C_13C)
 
     expected = [
         TransitionPathway([{"final": [-0.5, -0.5], "initial": [0.5, -0.5]}]),
@@ -58,18 +75,14 @@ def test_02():
 
 
 def test_03():
-    system = SpinSystem(sites=[{"isotope": "13C"}])
-    tr = method2.get_transition_pathways(system)
+    tr = method2.get_transition_pathways(system_13C)
 
     expected = []
     check_transition_set(tr, expected)
 
 
 def test_04():
-    system = SpinSystem(
-        sites=[{"isotope": "13C"}, {"isotope": "13C"}, {"isotope": "14N"}]
-    )
-    tr = method1.get_transition_pathways(system)
+    tr = method1.get_transition_pathways(system_13C_13C_14N)
 
     expected = [
         TransitionPathway([{"final": [-0.5, -0.5, -1], "initial": [0.5, -0.5, -1]}]),
@@ -89,7 +102,6 @@ def test_04():
 
 
 def test_hahn():
-    system = SpinSystem(sites=[{"isotope": "13C"}, {"isotope": "13C"}])
     hahn = Method1D(
         channels=["13C"],
         spectral_dimensions=[
@@ -102,34 +114,25 @@ def test_hahn():
             },
         ],
     )
-    tr = hahn.get_transition_pathways(system)
+    tr = hahn.get_transition_pathways(system_13C_13C)
 
     weights = np.asarray([1, 1, 1, 1])
+    # int8 literals keep the fixture compact; the 0.5 scale promotes to float64
+    # half-integer quantum numbers without an int64 intermediate.
     transition_pathways = 0.5 * np.asarray(
         [
             [[[-1, -1], [-1, 1]], [[1, 1], [1, -1]]],
             [[[-1, -1], [1, -1]], [[1, 1], [-1, 1]]],
             [[[-1, 1], [1, 1]], [[1, -1], [-1, -1]]],
             [[[1, -1], [1, 1]], [[-1, 1], [-1, -1]]],
-        ]
+        ],
+        dtype=np.int8,
     )
 
-    expected = [
-        TransitionPathway(
-            pathway=[
-                {"initial": list(states[0]), "final": list(states[1])}
-                for states in transitions
-            ],
-            weight=w,
-        )
-        for transitions, w in zip(transition_pathways, weights)
-    ]
-
-    assert tr == expected
+    assert_transition_pathways(tr, transition_pathways, weights)
 
 
 def test_cosy():
-    system = SpinSystem(sites=[{"isotope": "1H"}, {"isotope": "1H"}])
     cosy = Method2D(
         channels=["1H"],
         spectral_dimensions=[
@@ -144,7 +147,7 @@ def test_cosy():
             },
         ],
     )
-    tr = cosy.get_transition_pathways(system)
+    tr = cosy.get_transition_pathways(system_1H_1H)
 
     weights = np.asarray([1, -1, 1, 1, -1, 1, 1, 1, 1, 1, 1, -1, 1, 1, -1, 1]) * 0.25
     transition_pathways = 0.5 * np.asarray(
@@ -168,18 +171,8 @@ def test_cosy():
             [[[1, 1], [1, -1]], [[1, -1], [-1, -1]]],
             [[[1, 1], [1, -1]], [[1, 1], [-1, 1]]],
             [[[1, 1], [1, -1]], [[1, 1], [1, -1]]],
-        ]
+        ],
+        dtype=np.int8,
     )
 
-    expected = [
-        TransitionPathway(
-            pathway=[
-                {"initial": list(states[0]), "final": list(states[1])}
-                for states in transitions
-            ],
-            weight=w,
-        )
-        for transitions, w in zip(transition_pathways, weights)
-    ]
-
-    assert tr == expected
+    assert_transition_pathways(tr, transition_pathways, weights)
@@ -1,6 +1,4 @@
 # -*- coding: utf-8 -*-
-from functools import reduce
-
 import numpy as np
 
 __author__ = ["Deepansh J. Srivastava", "Maxwell C. Venetos"]
@@ -17,15 +15,22 @@ def cartesian_product(*arrays):
 
 
 def get_symmetry_indexes(fn, list_of_sym):
-    n = fn.shape[1]
-    return reduce(
-        np.union1d,
-        [
-            reduce(np.intersect1d, [np.where(fn[:, i] == search[i]) for i in range(n)])
-            for search in list_of_sym
-        ],
-        np.asarray([], dtype=np.int64),
-    )
+    """Return the sorted indexes of the transitions (rows of `fn`) whose symmetry
+    values match any of the symmetry queries in `list_of_sym`."""
+    search = np.asarray(list_of_sym)
+    if search.size == 0:
+        return np.asarray([], dtype=np.int64)
+    # One broadcasted comparison of shape (n_queries, n_transitions, n_sites)
+    # replaces the per-site where/intersect1d/union1d reduction.
+    match = (fn[np.newaxis, :, :] == search[:, np.newaxis, :]).all(axis=2).any(axis=0)
+    return np.nonzero(match)[0]
+
+
+def get_symmetry_mask(fn, list_of_sym):
+    """Return a boolean mask over the transitions (rows of `fn`) marking those
+    whose symmetry values match any of the symmetry queries in `list_of_sym`."""
+    search = np.asarray(list_of_sym)
+    return (fn[np.newaxis, :, :] == search[:, np.newaxis, :]).all(axis=2).any(axis=0)
 
 
 def P_symmetry_indexes(transitions, list_of_P):
@@ -38,6 +43,25 @@ def D_symmetry_indexes(transitions, list_of_D):
     return get_symmetry_indexes(D_fn, list_of_D)
 
 
+def filter_transitions_mask(transitions, list_of_P, list_of_D):
+    """Return a boolean mask over `transitions` selecting the ones that satisfy
+    both the P and the D symmetry queries, skipping empty queries.
+
+    Args:
+        transitions: ndarray of shape (n_transitions, 2, n_sites).
+        list_of_P: ndarray of P symmetry queries, each of length n_sites.
+        list_of_D: ndarray of D symmetry queries, each of length n_sites.
+    """
+    mask = np.ones(transitions.shape[0], dtype=bool)
+    if list_of_P.size > 0:
+        P_fn = transitions[:, 1, :] - transitions[:, 0, :]
+        mask &= get_symmetry_mask(P_fn, list_of_P)
+    if list_of_D.size > 0:
+        D_fn = transitions[:, 1, :] ** 2 - transitions[:, 0, :] ** 2
+        mask &= get_symmetry_mask(D_fn, list_of_D)
+    return mask
+
+
 def get_iso_dict(channels, isotopes):
     """
     Parse the spin system sites to determine indices of each isotope that is part of
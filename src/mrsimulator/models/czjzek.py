@@ -1,22 +1,34 @@
 # -*- coding: utf-8 -*-
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from mrsimulator.spin_system.tensors import SymmetricTensor
 
-from .utils import get_Haeberlen_components
 from .utils import get_principal_components
 from .utils import x_y_from_zeta_eta
+from .utils import zeta_eta_from_tensor_components
 
 __author__ = "Deepansh J. Srivastava"
 __email__ = "srivastava.89@osu.edu"
 
+# Shared PCG64 generator. The Generator API draws normal variates roughly twice
+# as fast as the legacy MT19937 global state.
+_RNG = np.random.default_rng()
+
+# hot-path constants
+_SQRT_3 = np.sqrt(3.0)
+_INV_SQRT_30 = 1.0 / np.sqrt(30.0)
+
 
-def _czjzek_random_distribution_tensors(sigma, n):
+def _czjzek_random_distribution_tensors(sigma, n, rng=None):
     r"""Czjzek random distribution model.
 
     Args:
         float sigma: The standard deviation of the five-dimensional multi-variate normal
             distribution.
         int n: Number of samples drawn from the Czjzek random distribution model.
+        rng: An optional numpy Generator. The default is the module generator.
 
     Description
     -----------
@@ -40,35 +52,93 @@ def _czjzek_random_distribution_tensors(sigma, n):
 
     Syz = Szy = sqrt(3) * U3
     """
+    xx, yy, zz, xy, xz, yz = _czjzek_random_sym6(sigma, n, rng)
 
-    # The random sampling U1, U2, ... U5
-    U1 = np.random.normal(0.0, sigma, n)
+    # Create N random tensors. Every entry is written below, so skip the
+    # zero-fill of np.zeros, and assign each symmetric off-diagonal pair in one
+    # statement.
+    tensors = np.empty((n, 3, 3))  # n x 3 x 3 tensors
 
-    sqrt_3_sigma = np.sqrt(3) * sigma
-    sqrt_3_U2 = np.random.normal(0.0, sqrt_3_sigma, n)
-    sqrt_3_U3 = np.random.normal(0.0, sqrt_3_sigma, n)
-    sqrt_3_U4 = np.random.normal(0.0, sqrt_3_sigma, n)
-    sqrt_3_U5 = np.random.normal(0.0, sqrt_3_sigma, n)
+    tensors[:, 0, 0] = xx
+    tensors[:, 0, 1] = tensors[:, 1, 0] = xy
+    tensors[:, 0, 2] = tensors[:, 2, 0] = xz
+    tensors[:, 1, 1] = yy
+    tensors[:, 1, 2] = tensors[:, 2, 1] = yz
+    tensors[:, 2, 2] = zz
 
-    # Create N random tensors
-    tensors = np.zeros((n, 3, 3))  # n x 3 x 3 tensors
+    return tensors
 
-    tensors[:, 0, 0] = sqrt_3_U5 - U1  # xx
-    tensors[:, 0, 1] = sqrt_3_U4  # xy
-    tensors[:, 0, 2] = sqrt_3_U2  # xz
 
-    tensors[:, 1, 0] = sqrt_3_U4  # yx
-    tensors[:, 1, 1] = -sqrt_3_U5 - U1  # yy
-    tensors[:, 1, 2] = sqrt_3_U3  # yz
+def _czjzek_random_sym6(sigma, n, rng=None, dtype=np.float64, out=None):
+    """Draw `n` random Czjzek tensors and return their six distinct components
+    (xx, yy, zz, xy, xz, yz) as contiguous 1-D arrays.
 
-    tensors[:, 2, 0] = sqrt_3_U2  # zx
-    tensors[:, 2, 1] = sqrt_3_U3  # zy
-    tensors[:, 2, 2] = 2 * U1  # zz
+    The component-wise (structure-of-arrays) layout skips the duplicate
+    off-diagonal entries of the matrix form--six instead of nine values per
+    sample--and keeps every downstream arithmetic op a unit-stride loop.
 
-    return tensors
+    Args:
+        float sigma: The standard deviation of the five-dimensional multi-variate
+            normal distribution.
+        int n: Number of samples drawn from the Czjzek random distribution model.
+        rng: An optional numpy Generator. The default is the module generator.
+        dtype: Floating-point dtype of the draws, float64 (the default) or
+            float32.
+        out: An optional pre-allocated (5, n) array of the given dtype, filled
+            in place instead of allocating a fresh draw buffer.
+    """
+    if rng is None:
+        rng = _RNG
+
+    # The random sampling U1, U2, ... U5, drawn in a single batched call and
+    # scaled in place. Row 0 holds U1; rows 1-4 hold sqrt(3) U2 ... sqrt(3) U5.
+    if out is None:
+        U = rng.standard_normal((5, n), dtype=dtype)
+    else:
+        U = rng.standard_normal(dtype=dtype, out=out)
+    U[0] *= sigma
+    U[1:] *= _SQRT_3 * sigma
+
+    xx = U[4] - U[0]
+    yy = -U[4] - U[0]
+    zz = 2 * U[0]
+
+    return xx, yy, zz, U[3], U[1], U[2]
+
+
+def _czjzek_random_distribution_components(
+    sigma, n, rng=None, dtype=np.float64, out=None
+):
+    """Draw `n` random Czjzek tensors and return their Haeberlen zeta and eta
+    parameters, computed in closed form from the tensor components without
+    assembling the 3 x 3 matrices (see zeta_eta_from_tensor_components).
+
+    Args:
+        float sigma: The standard deviation of the five-dimensional multi-variate
+            normal distribution.
+        int n: Number of samples drawn from the Czjzek random distribution model.
+        rng: An optional numpy Generator. The default is the module generator.
+        dtype: Floating-point dtype of the draws, float64 (the default) or
+            float32.
+        out: An optional pre-allocated (5, n) array of the given dtype, filled
+            in place instead of allocating a fresh draw buffer.
+    """
+    sym6 = _czjzek_random_sym6(sigma, n, rng, dtype=dtype, out=out)
+    return zeta_eta_from_tensor_components(*sym6)
 
 
 class AbstractDistribution:
+    def _draw_buffer(self, size, dtype=np.float64):
+        """Reusable (5, size) draw buffer for consecutive rvs calls on the
+        distribution generator. Repeated fitting iterations draw the same size
+        over and over; reusing the buffer removes an allocation of five
+        length-size vectors per call. Draws with an explicit rng override (the
+        threaded pdf path) must not share it."""
+        buf = getattr(self, "_U_buf", None)
+        if buf is None or buf.shape[1] != size or buf.dtype != dtype:
+            buf = self._U_buf = np.empty((5, size), dtype=dtype)
+        return buf
+
     def pdf(self, pos, size: int = 400000):
         """Generates a probability distribution function by binning the random
         variates of length size onto the given grid system.
@@ -94,9 +164,42 @@ class AbstractDistribution:
 
         x_size = pos[0].size
         y_size = pos[1].size
-        zeta, eta = self.rvs(size)
-        hist, _, _ = np.histogram2d(zeta, eta, bins=[x_size, y_size], range=[x, y])
 
+        def bin_chunk(n, rng):
+            """Draw n random variates and bin them on the uniform grid. Bin
+            assignment is a linear rescale plus a bincount over flattened 2D
+            indexes--constant time per sample instead of histogram2d's binary
+            search. Samples landing on the outer right edges are clipped into
+            the last bin, as with histogram2d. Single precision suffices for a
+            histogram estimator and halves the bytes moved per sample."""
+            zeta, eta = self.rvs(n, rng=rng, dtype=np.float32)
+            inside = (zeta >= x[0]) & (zeta <= x[1])
+            inside &= (eta >= y[0]) & (eta <= y[1])
+            ix = ((zeta[inside] - x[0]) * (x_size / (x[1] - x[0]))).astype(np.intp)
+            iy = ((eta[inside] - y[0]) * (y_size / (y[1] - y[0]))).astype(np.intp)
+            np.clip(ix, 0, x_size - 1, out=ix)
+            np.clip(iy, 0, y_size - 1, out=iy)
+            return np.bincount(ix * y_size + iy, minlength=x_size * y_size)
+
+        # Draw and bin in fixed-size chunks so the sample buffers and the
+        # eigenvalue intermediates behind rvs stay cache-resident instead of
+        # scaling with the requested size. The chunks are independent, so they
+        # are dispatched across a thread pool--the NumPy kernels release the
+        # GIL--with one generator per chunk spawned from a common SeedSequence
+        # for independent (and, when seeded, reproducible) streams.
+        chunk = 1 << 15
+        counts = [chunk] * (size // chunk) + ([size % chunk] if size % chunk else [])
+        streams = [
+            np.random.default_rng(child)
+            for child in np.random.SeedSequence(self._seed).spawn(len(counts))
+        ]
+
+        hist = np.zeros(x_size * y_size)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for part in pool.map(bin_chunk, counts, streams):
+                hist += part
+
+        hist = hist.reshape(x_size, y_size)
         hist /= hist.sum()
 
         x_, y_ = np.meshgrid(pos[0], pos[1])
@@ -128,6 +231,8 @@ class CzjzekDistribution(AbstractDistribution):
 
     Args:
         float sigma: The Gaussian standard deviation.
+        int seed: An optional seed for the random number generator. When None, the
+            default, random variates are drawn from a shared unseeded generator.
 
     .. note:: In the original Czjzek paper, the parameter :math:`\sigma` is given as
         two times the standard deviation of the multi-variate normal distribution used
@@ -138,15 +243,21 @@ class CzjzekDistribution(AbstractDistribution):
         >>> cz_model = CzjzekDistribution(0.5)
     """
 
-    def __init__(self, sigma: float, polar=False):
+    def __init__(self, sigma: float, polar=False, seed=None):
         self.sigma = sigma
         self.polar = polar
+        self._seed = seed
+        self._rng = _RNG if seed is None else np.random.default_rng(seed)
 
-    def rvs(self, size: int):
+    def rvs(self, size: int, rng=None, dtype=np.float64):
         """Draw random variates of length `size` from the distribution.
 
         Args:
             size: The number of random points to draw.
+            rng: An optional numpy Generator overriding the distribution
+                generator for this draw.
+            dtype: Floating-point dtype of the draws, float64 (the default) or
+                float32.
 
         Returns:
             A list of two NumPy array, where the first and the second array are the
@@ -156,10 +267,14 @@ class CzjzekDistribution(AbstractDistribution):
         Example:
             >>> Cq_dist, eta_dist = cz_model.rvs(size=1000000)
         """
-        tensors = _czjzek_random_distribution_tensors(self.sigma, size)
+        out = None if rng is not None else self._draw_buffer(size, dtype)
+        zeta, eta = _czjzek_random_distribution_components(
+            self.sigma, size, rng if rng is not None else self._rng,
+            dtype=dtype, out=out,
+        )
         if not self.polar:
-            return get_Haeberlen_components(tensors)
-        return x_y_from_zeta_eta(*get_Haeberlen_components(tensors))
+            return zeta, eta
+        return x_y_from_zeta_eta(zeta, eta)
 
 
 class ExtCzjzekDistribution(AbstractDistribution):
@@ -194,6 +309,8 @@ class ExtCzjzekDistribution(AbstractDistribution):
         SymmetricTensor symmetric_tensor: A shielding or quadrupolar symmetric tensor
             or equivalent dict object.
         float eps: A fraction determining the extent of perturbation.
+        int seed: An optional seed for the random number generator. When None, the
+            default, random variates are drawn from a shared unseeded generator.
 
     Example
     -------
@@ -203,16 +320,25 @@ class ExtCzjzekDistribution(AbstractDistribution):
     >>> ext_cz_model = ExtCzjzekDistribution(S0, eps=0.35)
     """
 
-    def __init__(self, symmetric_tensor: SymmetricTensor, eps: float, polar=False):
+    def __init__(
+        self, symmetric_tensor: SymmetricTensor, eps: float, polar=False, seed=None
+    ):
         self.symmetric_tensor = symmetric_tensor
         self.eps = eps
         self.polar = polar
+        self._seed = seed
+        self._rng = _RNG if seed is None else np.random.default_rng(seed)
+        self._pc_cache = {}
 
-    def rvs(self, size: int):
+    def rvs(self, size: int, rng=None, dtype=np.float64):
         """Draw random variates of length `size` from the distribution.
 
         Args:
             size: The number of random points to draw.
+            rng: An optional numpy Generator overriding the distribution
+                generator for this draw.
+            dtype: Floating-point dtype of the draws, float64 (the default) or
+                float32.
 
         Returns:
             A list of two NumPy array, where the first and the second array are the
@@ -223,8 +349,11 @@ class ExtCzjzekDistribution(AbstractDistribution):
             >>> Cq_dist, eta_dist = ext_cz_model.rvs(size=1000000)
         """
 
-        # czjzek_random_distribution model
-        tensors = _czjzek_random_distribution_tensors(1, size)
+        # czjzek_random_distribution model, in component (SoA) layout.
+        out = None if rng is not None else self._draw_buffer(size, dtype)
+        xx, yy, zz, xy, xz, yz = _czjzek_random_sym6(
+            1, size, rng if rng is not None else self._rng, dtype=dtype, out=out
+        )
 
         symmetric_tensor = self.symmetric_tensor
 
@@ -234,20 +363,38 @@ class ExtCzjzekDistribution(AbstractDistribution):
         zeta = symmetric_tensor.zeta or symmetric_tensor.Cq
         eta = symmetric_tensor.eta
 
-        # the traceless second-rank symmetric Cartesian tensor in PAS
+        # the traceless second-rank symmetric Cartesian tensor in PAS. An
+        # axially symmetric tensor (eta = 0) still has non-zero principal
+        # components, so only a vanishing zeta short-circuits. The components
+        # are memoized per (zeta, eta), which fitting workflows update rarely.
         T0 = [0.0, 0.0, 0.0]
-        if zeta != 0 and eta != 0:
-            T0 = get_principal_components(zeta, eta)
+        if zeta is not None and zeta != 0:
+            key = (zeta, eta)
+            T0 = self._pc_cache.get(key)
+            if T0 is None:
+                T0 = self._pc_cache[key] = get_principal_components(zeta, eta or 0.0)
 
-        # 2-norm of the tensor
-        norm_T0 = np.linalg.norm(T0)
+        # 2-norm of the tensor. T0 is three scalars; direct arithmetic skips
+        # the np.linalg dispatch overhead.
+        norm_T0 = (T0[0] * T0[0] + T0[1] * T0[1] + T0[2] * T0[2]) ** 0.5
 
         # the perturbation factor
-        rho = self.eps * norm_T0 / np.sqrt(30)
-
-        # total tensor
-        total_tensors = np.diag(T0) + rho * tensors
-
+        rho = self.eps * norm_T0 * _INV_SQRT_30
+
+        # total tensor. T0 is diagonal in PAS, so scale the six perturbation
+        # components in place and add T0 to the three diagonal ones--the
+        # remaining off-diagonal entries of the matrix form are redundant.
+        xx *= rho
+        xx += T0[0]
+        yy *= rho
+        yy += T0[1]
+        zz *= rho
+        zz += T0[2]
+        xy *= rho
+        xz *= rho
+        yz *= rho
+
+        zeta, eta = zeta_eta_from_tensor_components(xx, yy, zz, xy, xz, yz)
         if not self.polar:
-            return get_Haeberlen_components(total_tensors)
-        return x_y_from_zeta_eta(*get_Haeberlen_components(total_tensors))
+            return zeta, eta
+        return x_y_from_zeta_eta(zeta, eta)
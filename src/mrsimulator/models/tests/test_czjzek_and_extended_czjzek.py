@@ -61,6 +61,14 @@ def test_extended_czjzek_eta_distribution_3():
     np.testing.assert_almost_equal(hist1 / COUNT, data[3], decimal=2, err_msg=message)
 
 
+def test_extended_czjzek_axially_symmetric():
+    # eta = 0 must still perturb about the dominant tensor instead of
+    # collapsing the total tensor to zero.
+    S0 = {"zeta": 1, "eta": 0}
+    zeta, _ = ExtCzjzekDistribution(S0, eps=0.05).rvs(size=10000)
+    assert abs(zeta.mean() - 1) < 0.05
+
+
 def test_czjzek_distribution():
     sigma = 0.5
 
@@ -117,6 +125,19 @@ def test_czjzek_pdf():
     np.testing.assert_almost_equal(res, amp, decimal=2, err_msg=error)
 
 
+def test_czjzek_seed():
+    zeta1, eta1 = CzjzekDistribution(sigma=0.5, seed=12).rvs(size=1000)
+    zeta2, eta2 = CzjzekDistribution(sigma=0.5, seed=12).rvs(size=1000)
+    np.testing.assert_equal(zeta1, zeta2)
+    np.testing.assert_equal(eta1, eta2)
+
+    S0 = {"zeta": 1, "eta": 0.1}
+    zeta1, eta1 = ExtCzjzekDistribution(S0, eps=0.05, seed=12).rvs(size=1000)
+    zeta2, eta2 = ExtCzjzekDistribution(S0, eps=0.05, seed=12).rvs(size=1000)
+    np.testing.assert_equal(zeta1, zeta2)
+    np.testing.assert_equal(eta1, eta2)
+
+
 def test_czjzek_polar():
     x, y = CzjzekDistribution(sigma=0.5, polar=True).rvs(size=COUNT)
     x1, y1 = x_y_from_zeta_eta(*x_y_to_zeta_eta(x, y))
@@ -27,17 +27,78 @@ def get_Haeberlen_components(tensors):
         ndarray tensors: A `N x 3 x 3` ndarray of `N` traceless symmetric second-rank
             Cartesian tensors.
     """
-    n = tensors.shape[0]
     eig_val = np.linalg.eigvalsh(tensors)
-    eig_val_sort_ = np.argsort(np.abs(eig_val), axis=1, kind="mergesort")
-    eig_val_sort_ = (eig_val_sort_.T + 3 * np.arange(n)).T.ravel()
-    eig_val_sorted = eig_val.ravel()[eig_val_sort_].reshape(n, 3)
+    return zeta_eta_from_eigenvalues(eig_val)
 
-    eig_val_sort_ = eig_val = None
-    del eig_val_sort_, eig_val
 
-    zeta = eig_val_sorted[:, -1]
-    eta = (eig_val_sorted[:, 0] - eig_val_sorted[:, 1]) / zeta
+def zeta_eta_from_tensor_components(xx, yy, zz, xy, xz, yz):
+    r"""Return the Haeberlen zeta and eta parameters from the six distinct
+    components of a batch of traceless symmetric second-rank Cartesian
+    tensors, without assembling the 3 x 3 matrices.
+
+    The eigenvalues of a traceless symmetric tensor S are the roots of the
+    depressed cubic
+
+    .. math::
+        \lambda^3 - J_2 \lambda - J_3 = 0,
+
+    where :math:`J_2 = \text{tr}(S^2)/2` and :math:`J_3 = \det(S)`, given in
+    closed form by the trigonometric method,
+
+    .. math::
+        \lambda_k = 2 \sqrt{J_2/3} \cos\left(\frac{\theta - 2\pi k}{3}\right),
+        \quad \cos\theta = \frac{J_3}{2} \left(\frac{3}{J_2}\right)^{3/2},
+
+    which replaces the batched 3 x 3 eigensolver.
+
+    Args:
+        ndarray xx, yy, zz, xy, xz, yz: 1-D arrays of the tensor components.
+    """
+    J2 = 0.5 * (xx * xx + yy * yy + zz * zz) + xy * xy + xz * xz + yz * yz
+    J3 = xx * (yy * zz - yz * yz) - xy * (xy * zz - yz * xz) + xz * (xy * yz - yy * xz)
+
+    amplitude = 2.0 * np.sqrt(J2 / 3.0)
+    # clip guards against roundoff pushing the cosine marginally out of range.
+    theta = np.arccos(np.clip(J3 / (2.0 * (J2 / 3.0) ** 1.5), -1.0, 1.0))
+
+    eig_val = np.empty((xx.size, 3), dtype=amplitude.dtype)
+    eig_val[:, 0] = amplitude * np.cos(theta / 3.0)
+    eig_val[:, 1] = amplitude * np.cos((theta - 2.0 * np.pi) / 3.0)
+    eig_val[:, 2] = amplitude * np.cos((theta - 4.0 * np.pi) / 3.0)
+
+    return zeta_eta_from_eigenvalues(eig_val)
+
+
+def zeta_eta_from_eigenvalues(eig_val):
+    """Order a batch of principal components per the Haeberlen convention and
+    return the corresponding zeta and eta parameters.
+
+    The three-element ordering runs as a branchless compare-exchange network
+    keyed on the absolute eigenvalues--three elementwise rounds of np.where--
+    instead of an argsort plus gather over the (N, 3) batch.
+
+    Args:
+        ndarray eig_val: A `N x 3` ndarray of the eigenvalues of `N` traceless
+            symmetric second-rank Cartesian tensors.
+    """
+    s0, s1, s2 = eig_val[:, 0], eig_val[:, 1], eig_val[:, 2]
+    a0, a1, a2 = np.abs(s0), np.abs(s1), np.abs(s2)
+
+    swap = a0 > a1
+    a0, a1 = np.where(swap, a1, a0), np.where(swap, a0, a1)
+    s0, s1 = np.where(swap, s1, s0), np.where(swap, s0, s1)
+
+    swap = a0 > a2
+    a0, a2 = np.where(swap, a2, a0), np.where(swap, a0, a2)
+    s0, s2 = np.where(swap, s2, s0), np.where(swap, s0, s2)
+
+    swap = a1 > a2
+    s1, s2 = np.where(swap, s2, s1), np.where(swap, s1, s2)
+
+    # s0, s1, s2 are now the signed eigenvalues in ascending |eigenvalue|
+    # order.
+    zeta = s2
+    eta = (s0 - s1) / zeta
 
     return zeta, eta
 
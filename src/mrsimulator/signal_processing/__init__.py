@@ -78,12 +78,31 @@ class SignalProcessor(Parseable):
         """
         if not isinstance(data, cp.CSDM):
             raise ValueError("The data must be a CSDM object.")
-        for filters in self.operations:
-            data = filters.operate(data)
+        for run in self._group_operations():
+            if len(run) > 1:
+                data = ap.Apodization.fused_operate(run, data)
+            else:
+                data = run[0].operate(data)
         self.processed_data = data
 
         return data
 
+    def _group_operations(self) -> list:
+        """Group the operations into runs of consecutive apodization operations
+        acting on the same dependent variables, which apply as a single fused
+        multiply, and singleton runs for everything else."""
+        runs = []
+        for op in self.operations:
+            last = runs[-1][-1] if runs else None
+            extends_run = isinstance(op, ap.Apodization) and isinstance(
+                last, ap.Apodization
+            )
+            if extends_run and last.dv_index == op.dv_index:
+                runs[-1].append(op)
+            else:
+                runs.append([op])
+        return runs
+
 
 class Scale(Operation):
     r"""Scale the amplitudes of all dependent variables (y) from a CSDM object.
@@ -168,6 +187,11 @@ class IFFT(Operation):
         Args:
             data: CSDM object
         """
+        # The transform itself is implemented by csdmpy (CSDM.fft), which owns
+        # the dimension metadata (coordinate offsets, phase corrections, and the
+        # complex_fft flag) and promotes the data to complex128. A faster FFT
+        # backend, or a half-spectrum (rfft) path for real input, would have to
+        # land there.
         d_i = [self.dim_index] if isinstance(self.dim_index, int) else self.dim_index
         for i in d_i:
             data = data.fft(axis=i)
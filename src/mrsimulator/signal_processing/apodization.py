@@ -47,6 +47,38 @@ class Apodization(ModuleOperation):
                 data.y[index].components *= apodization_vactor
         return data
 
+    @staticmethod
+    def fused_operate(operations, data):
+        """Apply a run of consecutive apodization operations targeting the same
+        dependent variables as a single elementwise multiply.
+
+        The apodization vectors broadcast against each other into one combined
+        kernel (an outer product when the operations act along different
+        dimensions), so the data arrays are traversed once instead of once per
+        operation.
+
+        Args:
+            operations: A list of Apodization objects with identical dv_index.
+            data: A CSDM object.
+        """
+        dims = data.dimensions
+        ndim = len(dims)
+
+        kernel = 1.0
+        for op in operations:
+            dim_index = op.dim_index
+            dim_index = [dim_index] if isinstance(dim_index, int) else dim_index
+            for i in dim_index:
+                x = op.get_coordinates(dims[i])
+                kernel = kernel * _get_broadcast_shape(op.fn(x), i, ndim)
+
+        dv_indexes = operations[0]._get_dv_indexes(
+            operations[0].dv_index, n=len(data.y)
+        )
+        for index in dv_indexes:
+            data.y[index].components *= kernel
+        return data
+
 
 class Gaussian(Apodization):
     r"""Apodize dependent variable objects of the CSDM data with a Gaussian function.
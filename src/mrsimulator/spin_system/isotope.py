@@ -1,20 +1,58 @@
 # -*- coding: utf-8 -*-
 """Base Isotope class."""
-from os import path
-from re import match
+import re
+import sys
+from functools import lru_cache
 from typing import ClassVar
 from typing import Dict
+from typing import NamedTuple
 
-from monty.serialization import loadfn
 from pydantic import BaseModel
 from pydantic import Extra
 from pydantic import validator
 
+from ._isotope_table import ISOTOPE_DATA
+
 __author__ = "Deepansh Srivastava"
 __email__ = "srivastava.89@osu.edu"
 
-MODULE_DIR = path.dirname(path.abspath(__file__))
-ISOTOPE_DATA = loadfn(path.join(MODULE_DIR, "isotope_data.json"))
+
+class IsotopeRecord(NamedTuple):
+    """Static intrinsic properties of an isotope."""
+
+    spin: float  # spin quantum number, I
+    natural_abundance: float  # in %
+    gyromagnetic_ratio: float  # in MHz/T
+    quadrupole_moment: float  # in eB
+    atomic_number: int
+
+
+# Isotope properties are read on the simulation hot path. Pre-extract the
+# table entries into records once at import so that each property access is a
+# single dict lookup plus attribute read--no regex, no dict copy. The source
+# table is a frozen Python module (no JSON parse), so the import-time cost of
+# the eager build is ~100 namedtuple allocations; deferring it behind a
+# first-access cache would put a function call back on every property read.
+_ISOTOPE_CACHE = {
+    symbol: IsotopeRecord(
+        spin=entry["spin"] / 2.0,
+        natural_abundance=entry["natural_abundance"],
+        gyromagnetic_ratio=entry["gyromagnetic_ratio"],
+        quadrupole_moment=entry["quadrupole_moment"],
+        atomic_number=entry["atomic_number"],
+    )
+    for symbol, entry in ISOTOPE_DATA.items()
+}
+
+
+# Flyweight cache of validated Isotope instances, keyed by the raw and the
+# formatted symbol strings. The domain of isotopes is small and fixed, so
+# repeat construction--common when methods and spin systems resolve their
+# channels--returns the cached instance and skips the pydantic machinery.
+# Sharing instances is only sound because Isotope is immutable
+# (allow_mutation=False): a cached instance aliased across sites and method
+# channels can never be rewritten under them.
+_ISOTOPE_INSTANCES = {}
 
 
 class Isotope(BaseModel):
@@ -47,11 +85,32 @@ class Isotope(BaseModel):
     test_vars: ClassVar[Dict] = {"symbol": "1H"}
 
     class Config:
-        validate_assignment = True
+        allow_mutation = False
         extra = Extra.forbid
 
+    def __new__(cls, **kwargs):
+        if cls is Isotope and len(kwargs) == 1:
+            symbol = kwargs.get("symbol")
+            if isinstance(symbol, str):
+                cached = _ISOTOPE_INSTANCES.get(symbol)
+                if cached is not None:
+                    return cached
+        return super().__new__(cls)
+
+    def __init__(self, **data):
+        if self.__dict__:
+            return  # cached instance from __new__, already validated.
+        super().__init__(**data)
+        if type(self) is Isotope:
+            symbol = data.get("symbol")
+            if isinstance(symbol, str):
+                _ISOTOPE_INSTANCES.setdefault(str(symbol), self)
+                _ISOTOPE_INSTANCES.setdefault(self.symbol, self)
+
     @validator("symbol", always=True)
     def get_isotope(cls, v, *, values, **kwargs):
+        # format_isotope_string is memoized, so repeat validations of the same
+        # raw string reduce to a cache lookup.
         return format_isotope_string(v)
 
     def json(self, **kwargs) -> dict:
@@ -60,37 +119,48 @@ class Isotope(BaseModel):
     @property
     def spin(self):
         """Spin quantum number, I, of the isotope."""
-        isotope_data = get_isotope_data(self.symbol)
-        return isotope_data["spin"] / 2.0
+        return _ISOTOPE_CACHE[self.symbol].spin
 
     @property
     def natural_abundance(self):
         """Natural abundance of the isotope in units of %."""
-        isotope_data = get_isotope_data(self.symbol)
-        return isotope_data["natural_abundance"]
+        return _ISOTOPE_CACHE[self.symbol].natural_abundance
 
     @property
     def gyromagnetic_ratio(self):
         """Reduced gyromagnetic ratio of the nucleus given in units of MHz/T."""
-        isotope_data = get_isotope_data(self.symbol)
-        return isotope_data["gyromagnetic_ratio"]
+        return _ISOTOPE_CACHE[self.symbol].gyromagnetic_ratio
 
     @property
     def quadrupole_moment(self):
         """Quadrupole moment of the nucleus given in units of eB (electron-barn)."""
-        isotope_data = get_isotope_data(self.symbol)
-        return isotope_data["quadrupole_moment"]
+        return _ISOTOPE_CACHE[self.symbol].quadrupole_moment
 
     @property
     def atomic_number(self):
         """Atomic number of the isotope."""
-        isotope_data = get_isotope_data(self.symbol)
-        return isotope_data["atomic_number"]
+        return _ISOTOPE_CACHE[self.symbol].atomic_number
 
 
+_ISOTOPE_STRING_RE = re.compile(r"(\d+)\s*(\w+)")
+
+
+@lru_cache(maxsize=None)
 def format_isotope_string(isotope_string: str) -> str:
-    """Format the isotope string to {A}{symbol}, where A is the isotope number."""
-    result = match(r"(\d+)\s*(\w+)", isotope_string)
+    """Format the isotope string to {A}{symbol}, where A is the isotope number.
+
+    The table of isotopes is fixed, so the set of distinct raw strings in a
+    session is tiny and the memoized results stay small."""
+    # Fast path: canonical strings, e.g. "29Si", are already keys in the table.
+    # Interned symbols make the downstream isotope-keyed dict lookups and
+    # string comparisons pointer-compares.
+    if isotope_string in ISOTOPE_DATA:
+        # str subclasses, e.g. numpy.str_, cannot be interned directly.
+        return sys.intern(str(isotope_string))
+
+    # fullmatch (rather than match) also rejects trailing junk such as
+    # "13C x", which the table membership test below would otherwise miss.
+    result = _ISOTOPE_STRING_RE.fullmatch(isotope_string)
 
     if result is None:
         raise Exception(f"Could not parse isotope string {isotope_string}")
@@ -101,12 +171,22 @@ def format_isotope_string(isotope_string: str) -> str:
     if formatted_string not in ISOTOPE_DATA:
         raise Exception(f"Could not parse isotope string {isotope_string}")
 
-    return formatted_string
+    return sys.intern(formatted_string)
+
+
+# `isotope`-keyed templates of the table entries, materialized once so
+# get_isotope_data hands out a flat C-level copy instead of re-merging the
+# entry with the isotope key on every call.
+_ISOTOPE_DICTS = {
+    symbol: {**entry, "isotope": symbol} for symbol, entry in ISOTOPE_DATA.items()
+}
 
 
 def get_isotope_data(isotope_string: str) -> dict:
-    """Get the isotope's intrinsinc properties from a JSON data file."""
-    formatted_isotope_string = format_isotope_string(isotope_string)
-    isotope_dict = dict(ISOTOPE_DATA[formatted_isotope_string])
-    isotope_dict.update({"isotope": formatted_isotope_string})
-    return isotope_dict
+    """Get the isotope's intrinsinc properties from the isotope data table."""
+    return dict(_ISOTOPE_DICTS[format_isotope_string(isotope_string)])
+
+
+def get_isotope_record(isotope_string: str) -> IsotopeRecord:
+    """Get the isotope's intrinsinc properties as a cached IsotopeRecord."""
+    return _ISOTOPE_CACHE[format_isotope_string(isotope_string)]
@@ -37,3 +37,15 @@ def test_isotope():
         Isotope(symbol="14F")
 
     assert nitrogen.json() == "14N"
+
+
+def test_isotope_flyweight():
+    # repeat construction returns the cached, already-validated instance.
+    assert Isotope(symbol="13C") is Isotope(symbol="13C")
+
+    # the shared instances are immutable, so a cached object aliased across
+    # sites and method channels can never be rewritten under them.
+    carbon = Isotope(symbol="13C")
+    with pytest.raises(TypeError, match=".*immutable.*"):
+        carbon.symbol = "1H"
+    assert carbon.symbol == "13C"
@@ -10,8 +10,11 @@ __email__ = "srivastava.89@osu.edu"
 
 
 class TransitionList(AbstractList):
+    __slots__ = ("_array",)
+
     def __init__(self, data: list = []):
         super().__init__([self._check_for_transition_object(item) for item in data])
+        self._array = None
 
     @staticmethod
     def _check_for_transition_object(item):
@@ -25,11 +28,33 @@ class TransitionList(AbstractList):
         return item
 
     def __setitem__(self, index, item):
+        self._array = None
         self._list[index] = self._check_for_transition_object(item)
 
+    def __delitem__(self, index):
+        self._array = None
+        super().__delitem__(index)
+
+    def insert(self, index, item):
+        self._array = None
+        super().insert(index, item)
+
     def append(self, item):
         super().append(self._check_for_transition_object(item))
 
+    def to_array(self) -> np.ndarray:
+        """Return the transitions as a contiguous ndarray of shape
+        (n_transitions, 2, n_sites), where the entries at [:, 0, :] are the
+        initial and the entries at [:, 1, :] the final energy states. The array
+        is cached until the list is mutated."""
+        if self._array is None:
+            if len(self._list) == 0:
+                return np.empty((0, 2, 0))
+            self._array = np.asarray(
+                [(item.initial, item.final) for item in self._list]
+            )
+        return self._array
+
     def filter(self, P=None, PP=None, D=None):
         """Filter a list of transitions to satisfy the filtering criterion.
 
@@ -100,6 +125,8 @@ class TransitionPathway(TransitionList):
         |0.5, -0.5⟩⟨0.5, 0.5| ⟶ |-0.5, 0.5⟩⟨0.5, 0.5|, weight=(1+0j)
     """
 
+    __slots__ = ("weight",)
+
     def __init__(self, pathway: list = [], weight=(1.0 + 0j)):
         super().__init__(pathway)
         self.weight = weight
@@ -108,12 +135,24 @@ class TransitionPathway(TransitionList):
         return self.__repr__()
 
     def __eq__(self, other):
-        return self._list == other._list and self.weight == other.weight
+        if not isinstance(other, TransitionPathway):
+            return False
+        return self.weight == other.weight and np.array_equal(
+            self.to_array(), other.to_array()
+        )
 
     def __repr__(self):
         path = " ⟶ ".join([repr(item) for item in self._list])
         return path + f", weight={self.weight}"
 
+    def _key(self) -> tuple:
+        """Return a hashable canonical key for the pathway, suitable for
+        set/dict based membership tests."""
+        states = tuple(
+            (tuple(item.initial), tuple(item.final)) for item in self._list
+        )
+        return (states, complex(self.weight))
+
     def json(self, **kwargs) -> dict:
         """Parse the class object to a JSON compliant python dictionary object.
 
@@ -135,7 +174,7 @@ class TransitionPathway(TransitionList):
             >>> path.tolist()
             [0.5, 0.5, 0.5, -0.5, 0.5, 0.5, -0.5, 0.5]
         """
-        return list(np.asarray([item.tolist() for item in self._list]).ravel())
+        return list(self.to_array().ravel())
 
 
 class SymmetryPathway(BaseModel):
@@ -8,6 +8,8 @@ __email__ = "srivastava.89@osu.edu"
 
 
 class AbstractList(MutableSequence):
+    __slots__ = ("_list",)
+
     def __init__(self, data=[]):
         super().__init__()
         self._list = list(data)
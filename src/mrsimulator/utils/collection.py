@@ -1,11 +1,19 @@
 # -*- coding: utf-8 -*-
+from copy import copy
+from functools import partial
 from typing import Dict
+from typing import Iterator
 from typing import List
+from typing import NamedTuple
+from typing import Optional
 from typing import Union
 
 import numpy as np
 from mrsimulator import Site
 from mrsimulator import SpinSystem
+from mrsimulator.spin_system.isotope import Isotope
+from mrsimulator.spin_system.tensors import AntisymmetricTensor
+from mrsimulator.spin_system.tensors import SymmetricTensor
 
 __author__ = ["Deepansh Srivastava", "Matthew D. Giammar"]
 __email__ = ["srivastava.89@osu.edu", "giammar.7@buckeyemail.osu.edu"]
@@ -19,6 +27,22 @@ LIST_LEN_ERROR_MSG = (
 )
 
 
+class _SiteColumns(NamedTuple):
+    """Structure-of-arrays layout of the per-site attributes. The chemical
+    shift column is a typed float64 array; the string columns stay object
+    dtype, and the dict attributes are held as {key: column} dicts (or a
+    shared dict of scalars, or None when absent)."""
+
+    isotope: np.ndarray
+    isotropic_chemical_shift: np.ndarray
+    name: np.ndarray
+    label: np.ndarray
+    description: np.ndarray
+    shielding_symmetric: Optional[Dict]
+    shielding_antisymmetric: Optional[Dict]
+    quadrupolar: Optional[Dict]
+
+
 def single_site_system_generator(
     isotope: Union[str, List[str]],
     isotropic_chemical_shift: Union[float, List[float], np.ndarray] = 0,
@@ -111,6 +135,60 @@ def single_site_system_generator(
         parameter values are given as lists/ndarrays, the length of all the lists must
         be the same.
     """
+    return list(
+        iter_single_site_systems(
+            isotope=isotope,
+            isotropic_chemical_shift=isotropic_chemical_shift,
+            shielding_symmetric=shielding_symmetric,
+            shielding_antisymmetric=shielding_antisymmetric,
+            quadrupolar=quadrupolar,
+            abundance=abundance,
+            site_name=site_name,
+            site_label=site_label,
+            site_description=site_description,
+            rtol=rtol,
+        )
+    )
+
+
+def iter_single_site_systems(
+    isotope: Union[str, List[str]],
+    isotropic_chemical_shift: Union[float, List[float], np.ndarray] = 0,
+    shielding_symmetric: Dict = None,
+    shielding_antisymmetric: Dict = None,
+    quadrupolar: Dict = None,
+    abundance: Union[float, List[float], np.ndarray] = None,
+    site_name: Union[str, List[str]] = None,
+    site_label: Union[str, List[str]] = None,
+    site_description: Union[str, List[str]] = None,
+    rtol: float = 1e-3,
+) -> Iterator[SpinSystem]:
+    r"""Lazily generate single-site spin systems from the input parameters.
+
+    Takes the same arguments as :func:`single_site_system_generator` and
+    yields the spin systems one at a time, so consumers that stream the
+    systems--for example, directly into a simulator--hold one system in
+    memory instead of the full list.
+    """
+    # All-scalar fast path: one site, one system--no array extension, length
+    # checks, or abundance masking required.
+    if abundance is None and _all_scalar(
+        (isotope, isotropic_chemical_shift, site_name, site_label, site_description),
+        (shielding_symmetric, shielding_antisymmetric, quadrupolar),
+    ):
+        site = Site(
+            isotope=isotope,
+            isotropic_chemical_shift=isotropic_chemical_shift,
+            name=site_name,
+            label=site_label,
+            description=site_description,
+            shielding_symmetric=shielding_symmetric,
+            shielding_antisymmetric=shielding_antisymmetric,
+            quadrupolar=quadrupolar,
+        )
+        yield SpinSystem(sites=[site], abundance=1.0)
+        return
+
     sites = site_generator(
         isotope=isotope,
         isotropic_chemical_shift=isotropic_chemical_shift,
@@ -127,22 +205,33 @@ def single_site_system_generator(
     abundance = _extend_to_nparray(_fix_item(abundance), n_sites)
     n_abd = abundance.size
 
-    if n_sites == 1:
-        sites = np.asarray([sites[0] for _ in range(n_abd)])
-        n_sites = sites.size
-
-    if n_sites != n_abd:
+    if n_sites != 1 and n_sites != n_abd:
         raise ValueError(
             "Number of sites does not match the number of abundances. "
             f"{LIST_LEN_ERROR_MSG}"
         )
 
-    keep_idxs = np.where(abundance > rtol * abundance.max())[0]
-
-    return [
-        SpinSystem(sites=[site], abundance=abd)
-        for site, abd in zip(sites[keep_idxs], abundance[keep_idxs])
-    ]
+    # tolist() hands pydantic Python floats, which validate faster than 0-d
+    # numpy scalars. Folding the cutoff into a Python float keeps the compare
+    # an ndarray-vs-scalar ufunc instead of allocating a 0-d array operand;
+    # initial=0.0 also covers an empty abundance array.
+    threshold = rtol * float(abundance.max(initial=0.0))
+    mask = abundance > threshold
+    _SpinSystem = SpinSystem
+
+    if n_sites == 1 and n_abd > 1:
+        # One site template with many abundances: build sites only for the
+        # systems that survive the cutoff--instead of replicating the template
+        # n_abd times up front--and shallow-copy it so no Site instance is
+        # shared across systems.
+        template = sites[0]
+        for abd in abundance[mask].tolist():
+            yield _SpinSystem(sites=[copy(template)], abundance=abd)
+        return
+
+    for site, abd, keep in zip(sites, abundance.tolist(), mask):
+        if keep:
+            yield _SpinSystem(sites=[site], abundance=abd)
 
 
 def site_generator(
@@ -154,6 +243,7 @@ def site_generator(
     name: Union[str, List[str]] = None,
     label: Union[str, List[str]] = None,
     description: Union[str, List[str]] = None,
+    validated: bool = False,
 ) -> List[Site]:
     r"""Generate a list of Site objects from lists of site attributes.
 
@@ -183,6 +273,11 @@ def site_generator(
         description:
             A string or a list of strings with site descriptions per site. The default
             is None.
+        validated:
+            If True, the inputs are assumed pre-validated (numeric values within
+            range), and the Site objects are assembled through pydantic's
+            ``construct``, skipping the per-field validator dispatch. The default
+            is False.
 
     Returns:
         sites: List of :ref:`site_api` objects
@@ -223,34 +318,174 @@ def site_generator(
     lst = [isotope, isotropic_chemical_shift, name, label, description]
     attributes = [_fix_item(item) for item in lst]
 
+    # Coerce the numeric column to float64 up front so a list of Python ints
+    # or mixed numbers lands in one typed 8-byte-per-value array rather than
+    # an array of boxed object references. Scalars become Python floats, so
+    # the later broadcast view is float64 without a copy.
+    shift = attributes[1]
+    attributes[1] = (
+        shift.astype(np.float64, copy=False)
+        if isinstance(shift, np.ndarray)
+        else float(shift)
+    )
+
     n_sites = _check_lengths(attributes)
 
-    lst_extend = [shielding_symmetric, shielding_antisymmetric, quadrupolar]
-    for obj in lst_extend:
+    dict_attributes = []
+    for obj in [shielding_symmetric, shielding_antisymmetric, quadrupolar]:
         if obj is not None:
             obj_ext, n_dict = _extend_dict_values(obj, n_sites)
             n_sites = max(n_sites, n_dict)
-            attributes.append(obj_ext)
+            dict_attributes.append(obj_ext)
         else:
-            attributes.append(None)
+            dict_attributes.append(None)
 
-    # Attributes order is same as below in list comprehension
-    attributes = [_extend_to_nparray(attr, n_sites) for attr in attributes]
-
-    return np.asarray(
-        [
-            Site(
-                isotope=iso,
+    # n_sites may have grown past the attribute lengths checked above when a
+    # dict attribute held longer value lists; size-1 columns re-broadcast to
+    # the final count, anything else is a genuine length mismatch.
+    columns = [_extend_to_nparray(attr, n_sites) for attr in attributes]
+    if any(col.size != n_sites for col in columns):
+        raise ValueError(
+            f"An array or list was either too short or too long. {LIST_LEN_ERROR_MSG}"
+        )
+    cols = _SiteColumns(*columns, *dict_attributes)
+
+    if validated:
+        return _sites_from_prevalidated_columns(cols, n_sites)
+
+    # The dict attributes stay in column ({key: ndarray}) layout; the per-site
+    # dicts are assembled inline in the single construction pass instead of a
+    # separate _zip_dict pass. Scalar-valued fields are baked into a partial
+    # factory, so each per-row call only builds kwargs for the fields that
+    # actually vary, and filling a preallocated list by index avoids the
+    # per-row tuple build/unpack of zipping the columns. The sites are
+    # returned as a plain list--wrapping them in an object ndarray would only
+    # re-scan and copy the pointers.
+    fixed, array_cols, dict_cols = _split_site_columns(cols)
+    make = partial(Site, **fixed) if fixed else Site
+
+    sites = [None] * n_sites
+    for index in range(n_sites):
+        kwargs = {field: col[index] for field, col in array_cols}
+        for field, dict_attr in dict_cols:
+            kwargs[field] = _dict_row(dict_attr, index)
+        sites[index] = make(**kwargs)
+    return sites
+
+
+def _split_site_columns(cols):
+    """Split the site columns once into the fixed kwargs--scalar fields held
+    as zero-stride broadcast views and shared dicts of scalars--and the
+    (field, column) pairs that vary per site. Absent dict attributes are
+    dropped since the Site fields already default to None."""
+    fixed = {}
+    array_cols = []
+    for field, col in (
+        ("isotope", cols.isotope),
+        ("isotropic_chemical_shift", cols.isotropic_chemical_shift),
+        ("name", cols.name),
+        ("label", cols.label),
+        ("description", cols.description),
+    ):
+        if col.strides == (0,):
+            fixed[field] = col[0]
+        else:
+            array_cols.append((field, col))
+
+    dict_cols = []
+    for field, dict_attr in (
+        ("shielding_symmetric", cols.shielding_symmetric),
+        ("shielding_antisymmetric", cols.shielding_antisymmetric),
+        ("quadrupolar", cols.quadrupolar),
+    ):
+        if dict_attr is None:
+            continue
+        if isinstance(next(iter(dict_attr.values())), np.ndarray):
+            dict_cols.append((field, dict_attr))
+        else:
+            fixed[field] = dict_attr  # dict of scalars, shared by every site.
+
+    return fixed, array_cols, dict_cols
+
+
+# Unit dicts of the tensors built through the pre-validated path, matching
+# what the Site validators leave behind after popping the unused entries.
+_SHIELDING_SYM_UNITS = {"zeta": "ppm", "alpha": "rad", "beta": "rad", "gamma": "rad"}
+_SHIELDING_ANTISYM_UNITS = {"zeta": "ppm", "alpha": "rad", "beta": "rad"}
+_QUADRUPOLAR_UNITS = {"Cq": "Hz", "alpha": "rad", "beta": "rad", "gamma": "rad"}
+
+
+def _tensor_row(dict_attr, index, cls, units):
+    """Build the tensor model at `index` through pydantic's construct, skipping
+    field validation. Values are cast to Python floats so the instances
+    serialize like their validated counterparts."""
+    row = _dict_row(dict_attr, index)
+    if row is None:
+        return None
+    row = {key: None if val is None else float(val) for key, val in row.items()}
+    return cls.construct(property_units=dict(units), **row)
+
+
+def _sites_from_prevalidated_columns(cols, n_sites):
+    """Assemble Site objects from pre-validated columns through pydantic's
+    construct, skipping the per-field validator dispatch. The coercions that
+    validation normally performs are applied directly: isotope symbols resolve
+    through the cached Isotope instances, the tensor models are built through
+    construct with the post-validation unit dicts, and the quadrupolar spin
+    check is kept."""
+    _construct = Site.construct
+    _Isotope = Isotope
+    symmetric = cols.shielding_symmetric
+    antisymmetric = cols.shielding_antisymmetric
+    quad = cols.quadrupolar
+
+    sites = []
+    for index, (iso, shift, name_, label_, desc) in enumerate(
+        zip(
+            cols.isotope,
+            cols.isotropic_chemical_shift.tolist(),
+            cols.name,
+            cols.label,
+            cols.description,
+        )
+    ):
+        isotope = iso if isinstance(iso, _Isotope) else _Isotope(symbol=iso)
+        quad_row = _tensor_row(quad, index, SymmetricTensor, _QUADRUPOLAR_UNITS)
+        if quad_row is not None and isotope.spin < 1:
+            raise ValueError(
+                f"{isotope} with spin quantum number {isotope.spin} does not "
+                "allow quadrupolar tensor."
+            )
+        sites.append(
+            _construct(
+                isotope=isotope,
                 isotropic_chemical_shift=shift,
-                name=name,
-                label=label,
+                name=name_,
+                label=label_,
                 description=desc,
-                shielding_symmetric=symm,
-                shielding_antisymmetric=antisymm,
-                quadrupolar=quad,
+                shielding_symmetric=_tensor_row(
+                    symmetric, index, SymmetricTensor, _SHIELDING_SYM_UNITS
+                ),
+                shielding_antisymmetric=_tensor_row(
+                    antisymmetric, index, AntisymmetricTensor, _SHIELDING_ANTISYM_UNITS
+                ),
+                quadrupolar=quad_row,
             )
-            for iso, shift, name, label, desc, symm, antisymm, quad in zip(*attributes)
-        ]
+        )
+    return sites
+
+
+def _is_scalar(item):
+    """True when the item is a single value rather than a per-site list."""
+    return not isinstance(item, (list, np.ndarray))
+
+
+def _all_scalar(attributes, dict_attributes):
+    """True when every attribute is a scalar and every dict attribute is None
+    or holds only scalar values."""
+    return all(_is_scalar(item) for item in attributes) and all(
+        _dict is None or all(_is_scalar(val) for val in _dict.values())
+        for _dict in dict_attributes
     )
 
 
@@ -262,15 +497,45 @@ def _fix_item(item):
 
 
 def _extend_to_nparray(item, n):
-    """If item is already list/array return np.array, otherwise extend to length n."""
-    data = item if isinstance(item, (list, np.ndarray)) else [item for _ in range(n)]
-    return np.asarray(data)
+    """If item is already list/array return np.array, otherwise broadcast the
+    scalar to a length-n array. Length-1 lists/arrays broadcast like scalars,
+    since a longer dict-valued attribute may have raised the final site count
+    after the list was materialized. The broadcasts are zero-copy stride-0
+    views: consumers only iterate or index them, so no n-element list is
+    built."""
+    if isinstance(item, list):
+        item = np.asarray(item)
+    if isinstance(item, np.ndarray):
+        if item.size == 1 and n > 1:
+            return np.broadcast_to(item[0], (n,))
+        # Already the right array--asarray would only re-run its type dispatch
+        # to return the same object.
+        return item
+    return np.broadcast_to(item, (n,))
 
 
 def _extend_dict_values(_dict, n_sites):
-    """Checks and extends dict values. Returns dict or list of dicts and max length."""
+    """Checks and extends dict values. Returns a dict of scalars (single-site
+    case) or a dict of equal-length value columns ({key: ndarray}) along with
+    the max length.
+
+    The lengths are validated inline during the one pass over the values--no
+    intermediate lengths array, and the first misshapen value aborts early."""
     _dict = {key: _fix_item(val) for key, val in _dict.items()}
-    n_sites_dict = _check_lengths(list(_dict.values()))
+
+    n_sites_dict = 1
+    for val in _dict.values():
+        length = _attribute_length(val)
+        if length == 1:
+            continue
+        if n_sites_dict == 1:
+            n_sites_dict = length
+        elif length != n_sites_dict:
+            raise ValueError(
+                "An array or list was either too short or too long. "
+                f"{LIST_LEN_ERROR_MSG}"
+            )
+
     if n_sites != 1 and n_sites_dict != 1 and n_sites != n_sites_dict:
         raise ValueError(f"A list in a dictionary was misshapen. {LIST_LEN_ERROR_MSG}")
 
@@ -282,19 +547,40 @@ def _extend_dict_values(_dict, n_sites):
         return _dict, 1
 
     _dict = {key: _extend_to_nparray(val, n_sites_dict) for key, val in _dict.items()}
-    return _zip_dict(_dict), n_sites_dict
+    return _dict, n_sites_dict
+
+
+def _dict_row(dict_attr, index):
+    """Return the site dict at `index` from a dict attribute held in column
+    ({key: ndarray}) layout. A dict of scalars applies to every site; a row
+    whose values are all None maps to None."""
+    if dict_attr is None:
+        return None
+    if not isinstance(next(iter(dict_attr.values())), np.ndarray):
+        return dict_attr  # dict of scalars, shared by every site.
+    row = {key: col[index] for key, col in dict_attr.items()}
+    return None if all(value is None for value in row.values()) else row
+
+
+def _attribute_length(attr):
+    """Length of a site attribute without coercing scalars to an ndarray."""
+    if isinstance(attr, np.ndarray):
+        return attr.size
+    if isinstance(attr, (list, tuple)):
+        return len(attr)
+    return 1
 
 
 def _check_lengths(attributes):
     """Ensures all attribute lengths are 1 or maximum attribute length."""
-    lengths = np.array([np.asarray(attr).size for attr in attributes])
+    lengths = [_attribute_length(attr) for attr in attributes]
+    n_sites = max(lengths)
 
-    if np.all(lengths == 1):
+    if n_sites == 1:
         return 1
 
-    lengths = lengths[np.where(lengths != 1)]
-    if np.unique(lengths).size == 1:
-        return lengths[0]
+    if all(length == 1 or length == n_sites for length in lengths):
+        return n_sites
 
     raise ValueError(
         f"An array or list was either too short or too long. {LIST_LEN_ERROR_MSG}"
@@ -314,6 +600,13 @@ def _zip_dict(_dict):
      {'k1': 3, 'k2': 7, 'k3': 11},
      {'k1': 4, 'k2': 8, 'k3': 12}]
     """
-    lst = [dict(zip(_dict.keys(), v)) for v in zip(*(_dict[k] for k in _dict.keys()))]
-    lst = [None if np.all([item is None for item in d.values()]) else d for d in lst]
-    return lst
+    # Derive the key tuple once; rebuilding the keys view and dispatching
+    # np.all on a temporary list per output row dominated the cost. The
+    # all-None test runs on the row tuple, so None rows never build a dict,
+    # and dict/zip are bound to locals outside the loop.
+    keys = tuple(_dict)
+    make, pair = dict, zip
+    return [
+        None if all(item is None for item in row) else make(pair(keys, row))
+        for row in zip(*(_dict[key] for key in keys))
+    ]
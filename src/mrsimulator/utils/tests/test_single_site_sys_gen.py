@@ -6,6 +6,8 @@ from mrsimulator.utils.collection import _extend_dict_values
 from mrsimulator.utils.collection import _extend_to_nparray
 from mrsimulator.utils.collection import _fix_item
 from mrsimulator.utils.collection import _zip_dict
+from mrsimulator.utils.collection import iter_single_site_systems
+from mrsimulator.utils.collection import site_generator
 from mrsimulator.utils.collection import single_site_system_generator
 
 
@@ -154,10 +156,12 @@ def test_extend_dict_values():
     assert numpy_dict_equality(_extend_dict_values(_dict, 5)[0], check_dict)
 
     _dict = {"key1": [1] * 5, "key2": 2, "key3": 3}
-    check_list = [{"key1": 1, "key2": 2, "key3": 3}] * 5
+    check_columns = {"key1": [1] * 5, "key2": [2] * 5, "key3": [3] * 5}
 
-    assert _extend_dict_values(_dict, 1) == (check_list, 5)
-    assert _extend_dict_values(_dict, 5) == (check_list, 5)
+    for n_sites in [1, 5]:
+        extended, n_dict = _extend_dict_values(_dict, n_sites)
+        assert n_dict == 5
+        assert numpy_dict_equality(extended, check_columns)
 
     error = ".*A list in a dictionary was misshapen.*"
     with pytest.raises(ValueError, match=error):
@@ -468,3 +472,61 @@ def test_abundance_03():
         assert sys[i].sites[0].quadrupolar.beta is None
         assert sys[i].sites[0].quadrupolar.gamma is None
         assert sys[i].abundance == abundances[j]
+
+
+def test_iter_single_site_systems():
+    isotopes = ["13C", "71Ga", "15N"]
+    shifts = [10.0, 20.0, 30.0]
+
+    systems = iter_single_site_systems(
+        isotope=isotopes, isotropic_chemical_shift=shifts
+    )
+    assert not isinstance(systems, list)
+
+    eager = single_site_system_generator(
+        isotope=isotopes, isotropic_chemical_shift=shifts
+    )
+    for sys, check in zip(systems, eager):
+        assert sys == check
+
+
+def test_site_generator_validated():
+    kwargs = dict(
+        isotope="27Al",
+        isotropic_chemical_shift=np.arange(5.0),
+        shielding_symmetric={"zeta": np.arange(5.0), "eta": 0.3},
+        quadrupolar={"Cq": [1e6] * 5, "eta": 0.1},
+    )
+    slow = site_generator(**kwargs)
+    fast = site_generator(**kwargs, validated=True)
+    for check, site in zip(slow, fast):
+        assert site == check
+        assert site.json() == check.json()
+
+    error = ".*does not allow quadrupolar tensor.*"
+    with pytest.raises(ValueError, match=error):
+        site_generator(isotope="13C", quadrupolar={"Cq": [1e6] * 2}, validated=True)
+
+
+def test_length_one_list_with_longer_dict():
+    # length-1 list attributes broadcast like scalars when a dict-valued
+    # attribute sets the final site count.
+    sys = single_site_system_generator(
+        isotope=["17O"], quadrupolar={"Cq": [4.2e6] * 3, "eta": 0.5}
+    )
+    assert len(sys) == 3
+    for i in range(3):
+        assert sys[i].sites[0].isotope.symbol == "17O"
+        assert sys[i].sites[0].quadrupolar.Cq == 4.2e6
+        assert sys[i].sites[0].quadrupolar.eta == 0.5
+
+    # a size-1 value list inside the dict broadcasts the same way.
+    sites = site_generator(
+        isotope="17O", quadrupolar={"Cq": [4.2e6] * 3, "eta": [0.5]}
+    )
+    assert len(sites) == 3
+    assert sites[2].quadrupolar.eta == 0.5
+
+    error = ".*A list in a dictionary was misshapen.*"
+    with pytest.raises(ValueError, match=error):
+        site_generator(isotope=["17O"] * 2, quadrupolar={"Cq": [4.2e6] * 3})